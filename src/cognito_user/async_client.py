@@ -0,0 +1,42 @@
+"""Async Cognito client factory backed by aiobotocore.
+
+aiobotocore is an optional dependency (install with
+``pip install cognito-user[async]``). Callers should check
+HAS_AIOBOTOCORE before taking an async code path and fall back to the
+synchronous boto3 client otherwise.
+"""
+
+from contextlib import asynccontextmanager
+
+from botocore.config import Config
+
+from .config import get_aws_config
+
+try:
+    from aiobotocore.session import get_session
+
+    HAS_AIOBOTOCORE = True
+except ImportError:
+    get_session = None
+    HAS_AIOBOTOCORE = False
+
+
+@asynccontextmanager
+async def get_async_cognito_client():
+    """Yield an aiobotocore Cognito IDP client.
+
+    Raises:
+        RuntimeError: If aiobotocore is not installed.
+    """
+    if not HAS_AIOBOTOCORE:
+        raise RuntimeError(
+            "aiobotocore is not installed; install with: pip install cognito-user[async]"
+        )
+
+    session = get_session()
+    async with session.create_client(
+        "cognito-idp",
+        config=Config(retries={"mode": "adaptive", "max_attempts": 10}),
+        **get_aws_config(),
+    ) as client:
+        yield client
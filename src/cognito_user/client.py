@@ -1,11 +1,134 @@
 """Cognito client factory."""
 
+import asyncio
+import functools
+import os
+import threading
+import time
+
 import boto3
+from botocore.config import Config
+
+from .config import _ensure_dotenv, get_aws_config
+
+DEFAULT_RPS = 5.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting calls to a fixed rate.
+
+    Cognito admin APIs throttle at roughly 5-10 requests/sec per pool.
+    Concurrent workers acquire a token before each call so they self-pace
+    instead of triggering TooManyRequestsException retry storms.
+    """
+
+    def __init__(self, rate_per_sec=None):
+        # None defers the rate read to first acquire, so COGNITO_RPS set
+        # in .env (loaded lazily by the config module) is honored.
+        self.rate = rate_per_sec
+        self.capacity = rate_per_sec
+        self._tokens = rate_per_sec
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _resolve_rate(self):
+        """Read the configured rate on first use; call under the lock."""
+        if self.rate is None:
+            self.rate = _get_rps()
+            self.capacity = self.rate
+            self._tokens = self.rate
+            self._last_refill = time.monotonic()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._resolve_rate()
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Async variant of acquire(); awaits instead of blocking the loop."""
+        while True:
+            with self._lock:
+                self._resolve_rate()
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
 
-from .config import get_aws_config
+    def __enter__(self):
+        self.acquire()
+        return self
 
+    def __exit__(self, *exc_info):
+        return False
 
+
+def _get_rps():
+    """Read the configured request rate from the COGNITO_RPS env var."""
+    # COGNITO_RPS may come from .env, which is only loaded on first
+    # config access.
+    _ensure_dotenv()
+    try:
+        return float(os.environ.get("COGNITO_RPS", DEFAULT_RPS))
+    except ValueError:
+        return DEFAULT_RPS
+
+
+# Single limiter shared by every Cognito call site in this package; the
+# rate is resolved on first use, not at import time.
+limiter = RateLimiter()
+
+# One explicit Session so credential-resolver and endpoint state is shared
+# by every client built from this module.
+_SESSION = boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=1)
 def get_cognito_client():
-    """Create and return a Cognito IDP client."""
+    """Create and return a Cognito IDP client.
+
+    The client is built once and cached: construction loads service JSON
+    models and sets up the HTTPS connection pool (~100-300 ms), and every
+    caller can share the same pool. The pool is sized above the worker
+    count (COGNITO_POOL env var, default 50) so concurrent requests never
+    queue waiting for a connection or redo TLS handshakes.
+    """
     config = get_aws_config()
-    return boto3.client("cognito-idp", **config)
+    return _SESSION.client(
+        "cognito-idp",
+        config=Config(
+            max_pool_connections=int(os.environ.get("COGNITO_POOL", "50")),
+            connect_timeout=3,
+            read_timeout=10,
+            retries={"mode": "adaptive", "max_attempts": 10},
+        ),
+        **config,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def verify_credentials():
+    """Validate AWS credentials with a single STS call, failing fast.
+
+    Called once at CLI startup so bulk runs with bad credentials or the
+    wrong region abort immediately instead of burning one failed HTTP
+    round-trip per user. Raises botocore's ClientError (or
+    NoCredentialsError) on invalid configuration.
+    """
+    _SESSION.client("sts", **get_aws_config()).get_caller_identity()
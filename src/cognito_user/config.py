@@ -1,15 +1,28 @@
 """Configuration management using environment variables."""
 
+import functools
 import os
 
 from dotenv import load_dotenv
 
-# Load .env file from current working directory
-load_dotenv()
 
+@functools.lru_cache(maxsize=1)
+def _ensure_dotenv():
+    """Load the .env file from the current working directory, at most once.
 
+    Deferred to first use so importing the package never walks the
+    filesystem, and skipped entirely when DOTENV_SKIP=1 (e.g. Lambda or
+    container environments where the environment is already injected).
+    """
+    if os.environ.get("DOTENV_SKIP") != "1":
+        load_dotenv()
+    return True
+
+
+@functools.lru_cache(maxsize=1)
 def get_aws_config():
     """Get AWS configuration from environment variables."""
+    _ensure_dotenv()
     return {
         "aws_access_key_id": os.environ.get("AWS_ACCESS_KEY_ID"),
         "aws_secret_access_key": os.environ.get("AWS_SECRET_ACCESS_KEY"),
@@ -17,18 +30,33 @@ def get_aws_config():
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_pool_id():
     """Get Cognito User Pool ID from environment variable."""
+    _ensure_dotenv()
     return os.environ.get("AWS_COGNITO_USER_POOL_ID")
 
 
+@functools.lru_cache(maxsize=1)
 def get_excluded_users():
-    """Get list of users to exclude from deletion.
+    """Get the set of users to exclude from deletion.
 
     Returns:
-        List of usernames to exclude, or empty list if not set.
+        Frozenset of usernames to exclude, or empty frozenset if not set.
     """
+    _ensure_dotenv()
     excluded = os.environ.get("EXCLUDE_USERS", "")
     if not excluded:
-        return []
-    return [u.strip() for u in excluded.split(",") if u.strip()]
+        return frozenset()
+    return frozenset(u.strip() for u in excluded.split(",") if u.strip())
+
+
+def reload_config():
+    """Drop cached configuration so the next access re-reads the environment.
+
+    Useful for tests that mutate environment variables between calls.
+    """
+    _ensure_dotenv.cache_clear()
+    get_aws_config.cache_clear()
+    get_user_pool_id.cache_clear()
+    get_excluded_users.cache_clear()
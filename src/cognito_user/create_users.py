@@ -1,14 +1,33 @@
 """Create test users in AWS Cognito."""
 
 import argparse
+import asyncio
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
-from .client import get_cognito_client
+from .async_client import HAS_AIOBOTOCORE, get_async_cognito_client
+from .client import get_cognito_client, limiter, verify_credentials
 from .config import get_user_pool_id
+from .logging_setup import get_logger
 
 DEFAULT_PASSWORD = "Password123!"
 
+# Attribute entries shared by every created user; only the email entry
+# varies, so these are built once instead of per call.
+_STATIC_ATTRS = (
+    {"Name": "email_verified", "Value": "true"},
+    {"Name": "phone_number", "Value": "+6587654321"},
+    {"Name": "phone_number_verified", "Value": "true"},
+)
+
+# Cognito admin APIs throttle at roughly 5-10 requests/sec per pool, so more
+# workers than this just queue on the server side.
+MAX_WORKERS = 10
+
+logger = get_logger()
+
 
 def create_single_user(user_pool_id, email, password=DEFAULT_PASSWORD):
     """Create a single user in the specified Cognito User Pool.
@@ -24,96 +43,239 @@ def create_single_user(user_pool_id, email, password=DEFAULT_PASSWORD):
     client = get_cognito_client()
 
     try:
-        client.admin_create_user(
-            UserPoolId=user_pool_id,
-            Username=email,
-            UserAttributes=[
-                {"Name": "email", "Value": email},
-                {"Name": "email_verified", "Value": "true"},
-                {"Name": "phone_number", "Value": "+6587654321"},
-                {"Name": "phone_number_verified", "Value": "true"},
-            ],
-            MessageAction="SUPPRESS",
-        )
+        with limiter:
+            client.admin_create_user(
+                UserPoolId=user_pool_id,
+                Username=email,
+                UserAttributes=[{"Name": "email", "Value": email}, *_STATIC_ATTRS],
+                MessageAction="SUPPRESS",
+            )
 
-        client.admin_set_user_password(
-            UserPoolId=user_pool_id,
-            Username=email,
-            Password=password,
-            Permanent=True,
-        )
+        with limiter:
+            client.admin_set_user_password(
+                UserPoolId=user_pool_id,
+                Username=email,
+                Password=password,
+                Permanent=True,
+            )
 
-        print(f"Successfully created user: {email}")
+        logger.info(f"Successfully created user: {email}")
         return True
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "UsernameExistsException":
-            print(f"Error: User already exists: {email}")
+            logger.error(f"Error: User already exists: {email}")
         else:
-            print(f"Error: Failed to create {email}: {e}")
+            logger.error(f"Error: Failed to create {email}: {e}")
         return False
 
 
-def create_test_users(user_pool_id, num_users, password=DEFAULT_PASSWORD):
+async def _async_create_test_users(user_pool_id, num_users, password, use_permanent_password=False):
+    """Async variant of create_test_users using a single aiobotocore client.
+
+    All creations run as coroutines on one event loop, bounded by a
+    semaphore, avoiding the per-thread overhead of the executor path.
+    """
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+    created_count = 0
+    failed_count = 0
+
+    async with get_async_cognito_client() as client:
+
+        async def _create_one(i):
+            email = f"testuser{i}@example.com"
+
+            async with semaphore:
+                try:
+                    await limiter.acquire_async()
+                    await client.admin_create_user(
+                        UserPoolId=user_pool_id,
+                        Username=email,
+                        UserAttributes=[
+                            {"Name": "email", "Value": email},
+                            *_STATIC_ATTRS,
+                        ],
+                        TemporaryPassword=password,
+                        MessageAction="SUPPRESS",
+                    )
+
+                    if use_permanent_password:
+                        await limiter.acquire_async()
+                        await client.admin_set_user_password(
+                            UserPoolId=user_pool_id,
+                            Username=email,
+                            Password=password,
+                            Permanent=True,
+                        )
+
+                    return True, email
+
+                except ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+                    if error_code == "UsernameExistsException":
+                        logger.info(f"User already exists: {email}")
+                    else:
+                        logger.info(f"Failed to create {email}: {e}")
+                    return False, email
+
+        results = await asyncio.gather(
+            *[_create_one(i) for i in range(1, num_users + 1)]
+        )
+
+    for ok, email in results:
+        if ok:
+            logger.info(f"Created user: {email}")
+            created_count += 1
+        else:
+            failed_count += 1
+
+    logger.info(f"\nSummary:")
+    logger.info(f"  Created: {created_count} users")
+    logger.info(f"  Failed/Skipped: {failed_count} users")
+
+    return created_count, failed_count
+
+
+def create_test_users(
+    user_pool_id, num_users, password=DEFAULT_PASSWORD, use_permanent_password=False
+):
     """Create test users in the specified Cognito User Pool.
 
+    Uses async I/O via aiobotocore when it is installed; otherwise falls
+    back to threaded sync boto3 calls.
+
+    By default the password is set via TemporaryPassword on
+    admin_create_user, which halves the calls per user; the account is
+    left in FORCE_CHANGE_PASSWORD, which is fine for throwaway test
+    users. Pass use_permanent_password=True to get sign-in-ready users
+    at the cost of a second call per user.
+
     Args:
         user_pool_id: The Cognito User Pool ID.
         num_users: Number of test users to create.
         password: Password to set for all users.
+        use_permanent_password: Mark the password permanent with an extra
+            admin_set_user_password call per user.
 
     Returns:
         Tuple of (created_count, failed_count).
     """
+    if HAS_AIOBOTOCORE:
+        return asyncio.run(
+            _async_create_test_users(
+                user_pool_id, num_users, password, use_permanent_password
+            )
+        )
+
     client = get_cognito_client()
 
     created_count = 0
     failed_count = 0
 
-    for i in range(1, num_users + 1):
+    def _create_one(i):
+        """Create a single test user; returns (ok, email)."""
         email = f"testuser{i}@example.com"
 
         try:
-            client.admin_create_user(
-                UserPoolId=user_pool_id,
-                Username=email,
-                UserAttributes=[
-                    {"Name": "email", "Value": email},
-                    {"Name": "email_verified", "Value": "true"},
-                    {"Name": "phone_number", "Value": "+6587654321"},
-                    {"Name": "phone_number_verified", "Value": "true"},
-                ],
-                MessageAction="SUPPRESS",
-            )
-
-            client.admin_set_user_password(
-                UserPoolId=user_pool_id,
-                Username=email,
-                Password=password,
-                Permanent=True,
-            )
-
-            print(f"Created user: {email}")
-            created_count += 1
+            with limiter:
+                client.admin_create_user(
+                    UserPoolId=user_pool_id,
+                    Username=email,
+                    UserAttributes=[{"Name": "email", "Value": email}, *_STATIC_ATTRS],
+                    TemporaryPassword=password,
+                    MessageAction="SUPPRESS",
+                )
+
+            if use_permanent_password:
+                with limiter:
+                    client.admin_set_user_password(
+                        UserPoolId=user_pool_id,
+                        Username=email,
+                        Password=password,
+                        Permanent=True,
+                    )
+
+            return True, email
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "UsernameExistsException":
-                print(f"User already exists: {email}")
+                logger.info(f"User already exists: {email}")
             else:
-                print(f"Failed to create {email}: {e}")
-            failed_count += 1
+                logger.info(f"Failed to create {email}: {e}")
+            return False, email
+
+    # The work is pure network I/O, so overlap the HTTP round-trips.
+    # botocore clients are thread-safe, so all workers share one client.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(_create_one, i) for i in range(1, num_users + 1)]
+
+        for future in as_completed(futures):
+            ok, email = future.result()
+            if ok:
+                logger.info(f"Created user: {email}")
+                created_count += 1
+            else:
+                failed_count += 1
 
-    print(f"\nSummary:")
-    print(f"  Created: {created_count} users")
-    print(f"  Failed/Skipped: {failed_count} users")
+    logger.info(f"\nSummary:")
+    logger.info(f"  Created: {created_count} users")
+    logger.info(f"  Failed/Skipped: {failed_count} users")
 
     return created_count, failed_count
 
 
+def _isolated_worker(user_pool_id, num_users, password, use_permanent_password):
+    """Subprocess entry point: run the async bulk creation on a fresh loop.
+
+    Must be a module-level function so it can be pickled by
+    ProcessPoolExecutor.
+    """
+    return asyncio.run(
+        _async_create_test_users(
+            user_pool_id, num_users, password, use_permanent_password
+        )
+    )
+
+
+def create_test_users_isolated(
+    user_pool_id, num_users, password=DEFAULT_PASSWORD, use_permanent_password=False
+):
+    """Run the async bulk creation in a subprocess with its own event loop.
+
+    Use this instead of create_test_users when calling from a host
+    application that already runs an event loop (Jupyter, FastAPI, ...)
+    where aiobotocore's client lifecycle cannot be entered on the running
+    loop.
+
+    Args:
+        user_pool_id: The Cognito User Pool ID.
+        num_users: Number of test users to create.
+        password: Password to set for all users.
+
+    Returns:
+        Tuple of (created_count, failed_count).
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            _isolated_worker, user_pool_id, num_users, password, use_permanent_password
+        )
+        return future.result()
+
+
 def main():
     """CLI entry point for creating test users."""
+    # Fast path for the common single-user invocation shape
+    # ("-e <email>" / "--email <email>"): skip argparse setup entirely,
+    # which matters when scripts spawn this command in tight loops.
+    if len(sys.argv) == 3 and sys.argv[1] in ("-e", "--email"):
+        user_pool_id = get_user_pool_id()
+        if not user_pool_id:
+            logger.error("Error: AWS_COGNITO_USER_POOL_ID environment variable not set")
+            return 1
+        return 0 if create_single_user(user_pool_id, sys.argv[2]) else 1
+
     parser = argparse.ArgumentParser(description="Create test users in AWS Cognito")
     parser.add_argument(
         "num_users",
@@ -135,7 +297,14 @@ def main():
 
     user_pool_id = get_user_pool_id()
     if not user_pool_id:
-        print("Error: AWS_COGNITO_USER_POOL_ID environment variable not set")
+        logger.error("Error: AWS_COGNITO_USER_POOL_ID environment variable not set")
+        return 1
+
+    # Fail fast on bad credentials before entering any loop
+    try:
+        verify_credentials()
+    except (BotoCoreError, ClientError) as e:
+        logger.error(f"Error: AWS credential check failed: {e}")
         return 1
 
     # Single user mode
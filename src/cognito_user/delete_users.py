@@ -1,16 +1,104 @@
 """Delete users from AWS Cognito."""
 
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
-from .client import get_cognito_client
+from .async_client import HAS_AIOBOTOCORE, get_async_cognito_client
+from .client import get_cognito_client, limiter, verify_credentials
 from .config import get_excluded_users, get_user_pool_id
+from .logging_setup import get_logger
+
+# Cognito admin APIs throttle at roughly 5-10 requests/sec per pool, so more
+# workers than this just queue on the server side.
+MAX_WORKERS = 10
+
+logger = get_logger()
+
+
+async def _async_delete_all_users(user_pool_id, excluded_set):
+    """Async variant of delete_all_users using a single aiobotocore client.
+
+    Deletions for each page run concurrently as coroutines, bounded by a
+    semaphore, while the next list_users page is fetched.
+    """
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+    deleted_count = 0
+    skipped_count = 0
+    failed_count = 0
+
+    async with get_async_cognito_client() as client:
+
+        async def _delete_one(username):
+            """Delete a single user; returns (ok, username)."""
+            async with semaphore:
+                try:
+                    await limiter.acquire_async()
+                    await client.admin_delete_user(
+                        UserPoolId=user_pool_id,
+                        Username=username,
+                    )
+                    logger.info(f"Deleted user: {username}")
+                    return True, username
+                except ClientError as e:
+                    logger.error(f"Failed to delete {username}: {e}")
+                    return False, username
+
+        tasks = []
+        pagination_token = None
+
+        try:
+            while True:
+                kwargs = {"UserPoolId": user_pool_id, "AttributesToGet": []}
+                if pagination_token:
+                    kwargs["PaginationToken"] = pagination_token
+
+                await limiter.acquire_async()
+                response = await client.list_users(**kwargs)
+
+                for user in response["Users"]:
+                    username = user["Username"]
+
+                    if username in excluded_set:
+                        logger.info(f"Skipping excluded user: {username}")
+                        skipped_count += 1
+                        continue
+
+                    tasks.append(asyncio.ensure_future(_delete_one(username)))
+
+                pagination_token = response.get("PaginationToken")
+                if not pagination_token:
+                    break
+
+        except ClientError as e:
+            logger.error(f"An error occurred: {e}")
+
+        # Drain every scheduled delete — even when listing aborted early —
+        # so no task outlives the client context. _delete_one swallows
+        # ClientError per user, so one failure cannot sink the batch.
+        for ok, _ in await asyncio.gather(*tasks):
+            if ok:
+                deleted_count += 1
+            else:
+                failed_count += 1
+
+    logger.info(f"\nSummary:")
+    logger.info(f"  Deleted: {deleted_count} users")
+    logger.info(f"  Skipped: {skipped_count} users (excluded)")
+    if failed_count:
+        logger.info(f"  Failed: {failed_count} users")
+
+    return deleted_count, skipped_count
 
 
 def delete_all_users(user_pool_id, excluded_usernames=None):
     """Delete all users from the specified Cognito User Pool.
 
+    Uses async I/O via aiobotocore when it is installed; otherwise falls
+    back to threaded sync boto3 calls.
+
     Args:
         user_pool_id: The Cognito User Pool ID.
         excluded_usernames: List of usernames to exclude from deletion.
@@ -18,49 +106,99 @@ def delete_all_users(user_pool_id, excluded_usernames=None):
     Returns:
         Tuple of (deleted_count, skipped_count).
     """
-    if excluded_usernames is None:
-        excluded_usernames = []
+    excluded_set = (
+        excluded_usernames
+        if isinstance(excluded_usernames, frozenset)
+        else frozenset(excluded_usernames or ())
+    )
+
+    if HAS_AIOBOTOCORE:
+        return asyncio.run(_async_delete_all_users(user_pool_id, excluded_set))
 
-    excluded_set = set(excluded_usernames)
     client = get_cognito_client()
 
-    pagination_token = None
     deleted_count = 0
     skipped_count = 0
+    failed_count = 0
 
-    try:
-        while True:
-            kwargs = {"UserPoolId": user_pool_id}
-            if pagination_token:
-                kwargs["PaginationToken"] = pagination_token
-
-            response = client.list_users(**kwargs)
-
-            for user in response["Users"]:
-                username = user["Username"]
-
-                if username in excluded_set:
-                    print(f"Skipping excluded user: {username}")
-                    skipped_count += 1
-                    continue
-
-                print(f"Deleting user: {username}")
+    def _delete_one(username):
+        """Delete a single user; returns (ok, username)."""
+        try:
+            with limiter:
                 client.admin_delete_user(
                     UserPoolId=user_pool_id,
                     Username=username,
                 )
-                deleted_count += 1
+            return True, username
+        except ClientError as e:
+            logger.error(f"Failed to delete {username}: {e}")
+            return False, username
 
-            pagination_token = response.get("PaginationToken")
-            if not pagination_token:
-                break
-
-        print(f"\nSummary:")
-        print(f"  Deleted: {deleted_count} users")
-        print(f"  Skipped: {skipped_count} users (excluded)")
+    try:
+        # Fan the deletes for each page out across the executor; each page's
+        # batch drains before the next page is fetched, bounding in-flight
+        # work to one page and keeping the list_users cursor consistent.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # The paginator handles PaginationToken bookkeeping; PageSize=60
+            # is the list_users maximum, cutting round-trips vs the default.
+            paginator = client.get_paginator("list_users")
+            pages = iter(
+                paginator.paginate(
+                    UserPoolId=user_pool_id,
+                    # Only Username is read from each record; skip the
+                    # attribute payload entirely.
+                    AttributesToGet=[],
+                    PaginationConfig={"PageSize": 60},
+                )
+            )
+
+            while True:
+                # The limiter paces the list_users calls along with the
+                # deletes, so page fetches draw from the same rate budget.
+                with limiter:
+                    response = next(pages, None)
+                if response is None:
+                    break
+
+                # Filter the page in one pass, then submit the survivors in
+                # bulk; skipped users are logged as a single joined message.
+                page_users = response["Users"]
+                to_delete = [
+                    u["Username"]
+                    for u in page_users
+                    if u["Username"] not in excluded_set
+                ]
+
+                skipped = len(page_users) - len(to_delete)
+                if skipped:
+                    skipped_count += skipped
+                    skipped_names = ", ".join(
+                        u["Username"]
+                        for u in page_users
+                        if u["Username"] in excluded_set
+                    )
+                    logger.info(f"Skipping excluded users: {skipped_names}")
+
+                futures = [
+                    executor.submit(_delete_one, username) for username in to_delete
+                ]
+
+                for future in as_completed(futures):
+                    ok, username = future.result()
+                    if ok:
+                        logger.info(f"Deleted user: {username}")
+                        deleted_count += 1
+                    else:
+                        failed_count += 1
+
+        logger.info(f"\nSummary:")
+        logger.info(f"  Deleted: {deleted_count} users")
+        logger.info(f"  Skipped: {skipped_count} users (excluded)")
+        if failed_count:
+            logger.info(f"  Failed: {failed_count} users")
 
     except ClientError as e:
-        print(f"An error occurred: {e}")
+        logger.error(f"An error occurred: {e}")
 
     return deleted_count, skipped_count
 
@@ -78,11 +216,18 @@ def main():
 
     user_pool_id = get_user_pool_id()
     if not user_pool_id:
-        print("Error: AWS_COGNITO_USER_POOL_ID environment variable not set")
+        logger.error("Error: AWS_COGNITO_USER_POOL_ID environment variable not set")
+        return 1
+
+    # Fail fast on bad credentials before entering any loop
+    try:
+        verify_credentials()
+    except (BotoCoreError, ClientError) as e:
+        logger.error(f"Error: AWS credential check failed: {e}")
         return 1
 
     # Combine excluded users from environment variable and command line
-    excluded_users = get_excluded_users() + args.exclude
+    excluded_users = get_excluded_users() | frozenset(args.exclude)
     delete_all_users(user_pool_id, excluded_users)
     return 0
 
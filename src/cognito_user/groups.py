@@ -0,0 +1,131 @@
+"""Group membership helpers for AWS Cognito.
+
+Kept free of Textual imports so CLI code paths can use these functions
+without paying the cost of loading the whole widget library.
+"""
+
+import operator
+import time
+
+from botocore.exceptions import ClientError
+
+from .client import get_cognito_client
+
+# Group lists change on human timescales, so screens re-mounting within the
+# TTL reuse the last fetch instead of re-paginating list_groups.
+_GROUPS_CACHE_TTL = 60.0
+_groups_cache: dict[str, tuple[float, list[tuple[str, str]]]] = {}
+
+
+def fetch_user_pool_groups(user_pool_id: str) -> list[tuple[str, str]]:
+    """Fetch all groups from the Cognito User Pool.
+
+    Results are cached per pool for a short TTL; call
+    ``fetch_user_pool_groups.cache_clear()`` to force a refresh.
+
+    Args:
+        user_pool_id: The Cognito User Pool ID.
+
+    Returns:
+        List of tuples (group_name, group_name) for use in Select/SelectionList widgets.
+    """
+    if not user_pool_id:
+        return []
+
+    cached = _groups_cache.get(user_pool_id)
+    if cached is not None and time.monotonic() - cached[0] < _GROUPS_CACHE_TTL:
+        return cached[1]
+
+    try:
+        client = get_cognito_client()
+        pages = client.get_paginator("list_groups").paginate(
+            UserPoolId=user_pool_id, PaginationConfig={"PageSize": 60}
+        )
+        groups = [
+            (group["GroupName"], group["GroupName"])
+            for page in pages
+            for group in page.get("Groups", ())
+        ]
+        groups.sort(key=operator.itemgetter(0))
+        _groups_cache[user_pool_id] = (time.monotonic(), groups)
+        return groups
+    except ClientError:
+        return []
+
+
+fetch_user_pool_groups.cache_clear = _groups_cache.clear
+
+
+def get_user_groups(user_pool_id: str, username: str) -> list[str]:
+    """Get the groups a user belongs to.
+
+    Args:
+        user_pool_id: The Cognito User Pool ID.
+        username: The username to look up.
+
+    Returns:
+        List of group names the user belongs to.
+    """
+    if not user_pool_id or not username:
+        return []
+
+    try:
+        client = get_cognito_client()
+        pages = client.get_paginator("admin_list_groups_for_user").paginate(
+            UserPoolId=user_pool_id,
+            Username=username,
+            PaginationConfig={"PageSize": 60},
+        )
+        return [
+            group["GroupName"] for page in pages for group in page.get("Groups", ())
+        ]
+    except ClientError:
+        return []
+
+
+def add_user_to_group(user_pool_id: str, username: str, group_name: str) -> tuple[bool, str]:
+    """Add a user to a group.
+
+    Args:
+        user_pool_id: The Cognito User Pool ID.
+        username: The username to add.
+        group_name: The group to add the user to.
+
+    Returns:
+        Tuple of (success, error_message). error_message is empty on success.
+    """
+    try:
+        client = get_cognito_client()
+        client.admin_add_user_to_group(
+            UserPoolId=user_pool_id,
+            Username=username,
+            GroupName=group_name,
+        )
+        return True, ""
+    except ClientError as e:
+        error_msg = e.response.get("Error", {}).get("Message", str(e))
+        return False, error_msg
+
+
+def remove_user_from_group(user_pool_id: str, username: str, group_name: str) -> tuple[bool, str]:
+    """Remove a user from a group.
+
+    Args:
+        user_pool_id: The Cognito User Pool ID.
+        username: The username to remove.
+        group_name: The group to remove the user from.
+
+    Returns:
+        Tuple of (success, error_message). error_message is empty on success.
+    """
+    try:
+        client = get_cognito_client()
+        client.admin_remove_user_from_group(
+            UserPoolId=user_pool_id,
+            Username=username,
+            GroupName=group_name,
+        )
+        return True, ""
+    except ClientError as e:
+        error_msg = e.response.get("Error", {}).get("Message", str(e))
+        return False, error_msg
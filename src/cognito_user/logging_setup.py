@@ -0,0 +1,46 @@
+"""Buffered logging setup for the CLI tools.
+
+Under concurrency, per-call print() makes stdout a shared lock plus one
+write() syscall per message. Worker threads instead log through a
+QueueHandler, and a single background QueueListener thread drains the
+records to stdout.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener = None
+
+
+def get_logger():
+    """Return the shared package logger, initializing handlers on first use."""
+    global _listener
+
+    logger = logging.getLogger("cognito_user")
+
+    if _listener is None:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+        atexit.register(stop_logging)
+
+    return logger
+
+
+def stop_logging():
+    """Flush pending records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,6 +1,12 @@
 """Terminal User Interface for AWS Cognito User Management."""
 
-from textual import on
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
@@ -22,130 +28,91 @@ from botocore.exceptions import ClientError
 
 from .client import get_cognito_client
 from .config import get_excluded_users, get_user_pool_id
+from .groups import (
+    add_user_to_group,
+    fetch_user_pool_groups,
+    get_user_groups,
+    remove_user_from_group,
+)
 
 DEFAULT_PASSWORD = "Password123!"
 
+# Created-date column format; bound once at module level so the per-user
+# loop does not re-read a literal each iteration.
+_DATE_FMT = "%Y-%m-%d %H:%M"
 
-def fetch_user_pool_groups(user_pool_id: str) -> list[tuple[str, str]]:
-    """Fetch all groups from the Cognito User Pool.
-
-    Args:
-        user_pool_id: The Cognito User Pool ID.
-
-    Returns:
-        List of tuples (group_name, group_name) for use in Select/SelectionList widgets.
-    """
-    if not user_pool_id:
-        return []
-
-    try:
-        client = get_cognito_client()
-        groups = []
-        next_token = None
-
-        while True:
-            kwargs = {"UserPoolId": user_pool_id}
-            if next_token:
-                kwargs["NextToken"] = next_token
-
-            response = client.list_groups(**kwargs)
-
-            for group in response.get("Groups", []):
-                group_name = group["GroupName"]
-                groups.append((group_name, group_name))
-
-            next_token = response.get("NextToken")
-            if not next_token:
-                break
-
-        return sorted(groups, key=lambda x: x[0])
-    except ClientError:
-        return []
-
-
-def get_user_groups(user_pool_id: str, username: str) -> list[str]:
-    """Get the groups a user belongs to.
-
-    Args:
-        user_pool_id: The Cognito User Pool ID.
-        username: The username to look up.
-
-    Returns:
-        List of group names the user belongs to.
-    """
-    if not user_pool_id or not username:
-        return []
+# How long a prefetched admin_get_user response stays usable when handed
+# from the view screen to the edit screen.
+_PREFETCH_TTL = 30.0
 
-    try:
-        client = get_cognito_client()
-        groups = []
-        next_token = None
 
-        while True:
-            kwargs = {"UserPoolId": user_pool_id, "Username": username}
-            if next_token:
-                kwargs["NextToken"] = next_token
+@lru_cache(maxsize=1)
+def _config_display_text() -> str:
+    """Format the settings summary once; config only changes on restart."""
+    from .config import get_aws_config
 
-            response = client.admin_list_groups_for_user(**kwargs)
+    config = get_aws_config()
+    user_pool_id = get_user_pool_id()
+    excluded_users = get_excluded_users()
 
-            for group in response.get("Groups", []):
-                groups.append(group["GroupName"])
+    return f"""AWS Region: {config.get('region_name', 'Not set')}
+AWS Access Key ID: {'*' * 16 + config.get('aws_access_key_id', '')[-4:] if config.get('aws_access_key_id') else 'Not set'}
+User Pool ID: {user_pool_id or 'Not set'}
+Excluded Users: {', '.join(excluded_users) if excluded_users else 'None'}
+"""
 
-            next_token = response.get("NextToken")
-            if not next_token:
-                break
 
-        return groups
-    except ClientError:
-        return []
+def _mask(name: str, value: str) -> str:
+    """Mask sensitive attribute values for display."""
+    return f"{value[:8]}...{value[-4:]}" if name == "sub" else value
 
 
-def add_user_to_group(user_pool_id: str, username: str, group_name: str) -> tuple[bool, str]:
-    """Add a user to a group.
+def _create_one_test_user(i, client, user_pool_id):
+    """Create one test user.
 
-    Args:
-        user_pool_id: The Cognito User Pool ID.
-        username: The username to add.
-        group_name: The group to add the user to.
+    Worker body for the bulk-create thread pool; the shared boto3 client
+    is thread-safe.
 
     Returns:
-        Tuple of (success, error_message). error_message is empty on success.
+        Tuple of (created, email).
     """
+    email = f"testuser{i}@example.com"
     try:
-        client = get_cognito_client()
-        client.admin_add_user_to_group(
+        # TemporaryPassword sets the password in the same request; the
+        # account stays in FORCE_CHANGE_PASSWORD, which is acceptable for
+        # throwaway test users and halves the calls per user.
+        client.admin_create_user(
             UserPoolId=user_pool_id,
-            Username=username,
-            GroupName=group_name,
+            Username=email,
+            UserAttributes=[
+                {"Name": "email", "Value": email},
+                {"Name": "email_verified", "Value": "true"},
+                {"Name": "phone_number", "Value": "+6587654321"},
+                {"Name": "phone_number_verified", "Value": "true"},
+            ],
+            TemporaryPassword=DEFAULT_PASSWORD,
+            MessageAction="SUPPRESS",
         )
-        return True, ""
-    except ClientError as e:
-        error_msg = e.response.get("Error", {}).get("Message", str(e))
-        return False, error_msg
+    except ClientError:
+        return False, email
 
+    return True, email
 
-def remove_user_from_group(user_pool_id: str, username: str, group_name: str) -> tuple[bool, str]:
-    """Remove a user from a group.
 
-    Args:
-        user_pool_id: The Cognito User Pool ID.
-        username: The username to remove.
-        group_name: The group to remove the user from.
+@dataclass(slots=True)
+class EditFormSnapshot:
+    """Values read from the edit form in one pass.
 
-    Returns:
-        Tuple of (success, error_message). error_message is empty on success.
+    Each query_one walks the DOM, so the button handlers read every widget
+    once up front instead of re-querying per field.
     """
-    try:
-        client = get_cognito_client()
-        client.admin_remove_user_from_group(
-            UserPoolId=user_pool_id,
-            Username=username,
-            GroupName=group_name,
-        )
-        return True, ""
-    except ClientError as e:
-        error_msg = e.response.get("Error", {}).get("Message", str(e))
-        return False, error_msg
+
+    email: str
+    phone: str
+    email_verified: bool
+    phone_verified: bool
+    new_password: str
+    enabled: bool
 
 
 class StatusBar(Static):
@@ -167,6 +134,8 @@ class ViewUserScreen(Screen):
     def __init__(self, username: str) -> None:
         super().__init__()
         self.username = username
+        self._last_response: dict | None = None
+        self._last_response_at = 0.0
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -192,12 +161,16 @@ class ViewUserScreen(Screen):
         )
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Load and display user details."""
-        self.load_user_details()
+        await self.load_user_details()
 
-    def load_user_details(self) -> None:
-        """Fetch and display user details from Cognito."""
+    async def load_user_details(self) -> None:
+        """Fetch and display user details from Cognito.
+
+        AWS calls run via asyncio.to_thread so the event loop keeps
+        painting and handling keys while the round-trips are in flight.
+        """
         status = self.query_one("#status", StatusBar)
         user_pool_id = get_user_pool_id()
 
@@ -207,9 +180,16 @@ class ViewUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            response = client.admin_get_user(
-                UserPoolId=user_pool_id,
-                Username=self.username,
+            # admin_get_user does not report group membership, so the
+            # groups call is unavoidable — issue both concurrently instead
+            # of paying two serial round-trips.
+            response, user_groups = await asyncio.gather(
+                asyncio.to_thread(
+                    client.admin_get_user,
+                    UserPoolId=user_pool_id,
+                    Username=self.username,
+                ),
+                asyncio.to_thread(get_user_groups, user_pool_id, self.username),
             )
 
             # Basic user info
@@ -232,7 +212,6 @@ Last Modified: {modified}
             self.query_one("#user-details", Static).update(details_text)
 
             # User groups
-            user_groups = get_user_groups(user_pool_id, self.username)
             if user_groups:
                 groups_text = "  " + ", ".join(user_groups)
             else:
@@ -241,18 +220,16 @@ Last Modified: {modified}
 
             # User attributes
             attributes = response.get("UserAttributes", [])
-            attr_lines = []
-            for attr in attributes:
-                name = attr["Name"]
-                value = attr["Value"]
-                # Mask sensitive values
-                if name == "sub":
-                    value = value[:8] + "..." + value[-4:]
-                attr_lines.append(f"  {name}: {value}")
-
-            attr_text = "\n".join(attr_lines) if attr_lines else "  No attributes"
+            attr_text = "\n".join(
+                f"  {attr['Name']}: {_mask(attr['Name'], attr['Value'])}"
+                for attr in attributes
+            ) or "  No attributes"
             self.query_one("#user-attributes", Static).update(attr_text)
 
+            # Keep the response so the edit screen can skip re-fetching it
+            self._last_response = response
+            self._last_response_at = time.monotonic()
+
             status.set_message(f"Loaded user: {self.username}")
 
         except ClientError as e:
@@ -261,7 +238,13 @@ Last Modified: {modified}
     @on(Button.Pressed, "#edit")
     def edit_user(self) -> None:
         """Open the edit user screen."""
-        self.app.push_screen(EditUserScreen(self.username))
+        self.app.push_screen(
+            EditUserScreen(
+                self.username,
+                prefetched=self._last_response,
+                prefetched_at=self._last_response_at,
+            )
+        )
 
     @on(Button.Pressed, "#back")
     def go_back(self) -> None:
@@ -276,11 +259,18 @@ class EditUserScreen(Screen):
         Binding("escape", "app.pop_screen", "Back"),
     ]
 
-    def __init__(self, username: str) -> None:
+    def __init__(
+        self,
+        username: str,
+        prefetched: dict | None = None,
+        prefetched_at: float = 0.0,
+    ) -> None:
         super().__init__()
         self.username = username
         self.user_enabled = True
-        self.current_groups: list[str] = []
+        self.current_groups: set[str] = set()
+        self._prefetched = prefetched
+        self._prefetched_at = prefetched_at
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -358,32 +348,17 @@ class EditUserScreen(Screen):
         )
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Load current user data."""
-        self.load_user_data()
-        self.load_groups()
+        await self._bootstrap()
 
-    def load_groups(self) -> None:
-        """Load available groups and user's current groups."""
-        user_pool_id = get_user_pool_id()
-        if not user_pool_id:
-            return
+    async def _bootstrap(self) -> None:
+        """Fetch user data and group info concurrently, then fill the form.
 
-        # Load all available groups for the dropdown
-        all_groups = fetch_user_pool_groups(user_pool_id)
-        group_select = self.query_one("#add-group", Select)
-        group_select.set_options(all_groups)
-
-        # Load user's current groups
-        self.current_groups = get_user_groups(user_pool_id, self.username)
-        current_groups_display = self.query_one("#current-groups", Static)
-        if self.current_groups:
-            current_groups_display.update(", ".join(self.current_groups))
-        else:
-            current_groups_display.update("(none)")
-
-    def load_user_data(self) -> None:
-        """Load current user attributes."""
+        The admin_get_user, list_groups, and admin_list_groups_for_user
+        calls are independent, so issuing them together cuts mount latency
+        from three round-trips to roughly one.
+        """
         status = self.query_one("#status", StatusBar)
         user_pool_id = get_user_pool_id()
 
@@ -391,43 +366,99 @@ class EditUserScreen(Screen):
             status.set_message("Error: User Pool ID not configured", error=True)
             return
 
-        try:
-            client = get_cognito_client()
-            response = client.admin_get_user(
-                UserPoolId=user_pool_id,
-                Username=self.username,
-            )
+        client = get_cognito_client()
 
-            # Set enabled status
-            self.user_enabled = response.get("Enabled", True)
-            self.query_one("#account-enabled", Checkbox).value = self.user_enabled
+        # Reuse the response handed over by the view screen when it is
+        # still fresh, saving one admin_get_user round-trip.
+        prefetched = None
+        if (
+            self._prefetched is not None
+            and time.monotonic() - self._prefetched_at < _PREFETCH_TTL
+        ):
+            prefetched = self._prefetched
 
-            # Set attributes
-            for attr in response.get("UserAttributes", []):
-                name = attr["Name"]
-                value = attr["Value"]
+        try:
+            if prefetched is not None:
+                response = prefetched
+                all_groups, user_groups = await asyncio.gather(
+                    asyncio.to_thread(fetch_user_pool_groups, user_pool_id),
+                    asyncio.to_thread(get_user_groups, user_pool_id, self.username),
+                )
+            else:
+                response, all_groups, user_groups = await asyncio.gather(
+                    asyncio.to_thread(
+                        client.admin_get_user,
+                        UserPoolId=user_pool_id,
+                        Username=self.username,
+                    ),
+                    asyncio.to_thread(fetch_user_pool_groups, user_pool_id),
+                    asyncio.to_thread(get_user_groups, user_pool_id, self.username),
+                )
+        except ClientError as e:
+            status.set_message(f"Error loading user: {e}", error=True)
+            return
 
-                if name == "email":
-                    self.query_one("#email", Input).value = value
-                elif name == "phone_number":
-                    self.query_one("#phone", Input).value = value
-                elif name == "email_verified":
-                    self.query_one("#email-verified", Checkbox).value = value.lower() == "true"
-                elif name == "phone_number_verified":
-                    self.query_one("#phone-verified", Checkbox).value = value.lower() == "true"
+        self._populate_form(response)
+        self._populate_groups(all_groups, user_groups)
+        status.set_message(f"Loaded user data for: {self.username}")
+
+    def _populate_form(self, response) -> None:
+        """Fill the form widgets from an admin_get_user response."""
+        self.user_enabled = response.get("Enabled", True)
+        self.query_one("#account-enabled", Checkbox).value = self.user_enabled
+
+        # query_one walks the DOM, so look each widget up once rather than
+        # once per attribute.
+        inputs = {
+            "email": self.query_one("#email", Input),
+            "phone_number": self.query_one("#phone", Input),
+        }
+        checkboxes = {
+            "email_verified": self.query_one("#email-verified", Checkbox),
+            "phone_number_verified": self.query_one("#phone-verified", Checkbox),
+        }
+
+        for attr in response.get("UserAttributes", []):
+            name = attr["Name"]
+            value = attr["Value"]
+
+            if name in inputs:
+                inputs[name].value = value
+            elif name in checkboxes:
+                checkboxes[name].value = value.lower() == "true"
+
+    def _populate_groups(self, all_groups, user_groups) -> None:
+        """Fill the group dropdown and current-membership display."""
+        group_select = self.query_one("#add-group", Select)
+        group_select.set_options(all_groups)
 
-            status.set_message(f"Loaded user data for: {self.username}")
+        # A set makes the membership checks in the add/remove handlers O(1);
+        # only the display path needs an ordering.
+        self.current_groups = set(user_groups)
+        current_groups_display = self.query_one("#current-groups", Static)
+        if self.current_groups:
+            current_groups_display.update(", ".join(sorted(self.current_groups)))
+        else:
+            current_groups_display.update("(none)")
 
-        except ClientError as e:
-            status.set_message(f"Error loading user: {e}", error=True)
+    def _snapshot(self) -> EditFormSnapshot:
+        """Read the whole form once, one query_one per widget."""
+        return EditFormSnapshot(
+            email=self.query_one("#email", Input).value.strip(),
+            phone=self.query_one("#phone", Input).value.strip(),
+            email_verified=self.query_one("#email-verified", Checkbox).value,
+            phone_verified=self.query_one("#phone-verified", Checkbox).value,
+            new_password=self.query_one("#new-password", Input).value.strip(),
+            enabled=self.query_one("#account-enabled", Checkbox).value,
+        )
 
     @on(Button.Pressed, "#update-password")
-    def update_password(self) -> None:
+    async def update_password(self) -> None:
         """Update user password."""
         status = self.query_one("#status", StatusBar)
-        new_password = self.query_one("#new-password", Input).value.strip()
+        form = self._snapshot()
 
-        if not new_password:
+        if not form.new_password:
             status.set_message("Error: Password is required", error=True)
             return
 
@@ -438,10 +469,11 @@ class EditUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            client.admin_set_user_password(
+            await asyncio.to_thread(
+                client.admin_set_user_password,
                 UserPoolId=user_pool_id,
                 Username=self.username,
-                Password=new_password,
+                Password=form.new_password,
                 Permanent=True,
             )
             status.set_message("Password updated successfully")
@@ -452,13 +484,10 @@ class EditUserScreen(Screen):
             status.set_message(f"Error: {error_msg}", error=True)
 
     @on(Button.Pressed, "#update-attrs")
-    def update_attributes(self) -> None:
+    async def update_attributes(self) -> None:
         """Update user attributes."""
         status = self.query_one("#status", StatusBar)
-        email = self.query_one("#email", Input).value.strip()
-        phone = self.query_one("#phone", Input).value.strip()
-        email_verified = self.query_one("#email-verified", Checkbox).value
-        phone_verified = self.query_one("#phone-verified", Checkbox).value
+        form = self._snapshot()
 
         user_pool_id = get_user_pool_id()
         if not user_pool_id:
@@ -466,12 +495,12 @@ class EditUserScreen(Screen):
             return
 
         attributes = []
-        if email:
-            attributes.append({"Name": "email", "Value": email})
-            attributes.append({"Name": "email_verified", "Value": str(email_verified).lower()})
-        if phone:
-            attributes.append({"Name": "phone_number", "Value": phone})
-            attributes.append({"Name": "phone_number_verified", "Value": str(phone_verified).lower()})
+        if form.email:
+            attributes.append({"Name": "email", "Value": form.email})
+            attributes.append({"Name": "email_verified", "Value": str(form.email_verified).lower()})
+        if form.phone:
+            attributes.append({"Name": "phone_number", "Value": form.phone})
+            attributes.append({"Name": "phone_number_verified", "Value": str(form.phone_verified).lower()})
 
         if not attributes:
             status.set_message("Error: No attributes to update", error=True)
@@ -479,7 +508,8 @@ class EditUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            client.admin_update_user_attributes(
+            await asyncio.to_thread(
+                client.admin_update_user_attributes,
                 UserPoolId=user_pool_id,
                 Username=self.username,
                 UserAttributes=attributes,
@@ -491,10 +521,10 @@ class EditUserScreen(Screen):
             status.set_message(f"Error: {error_msg}", error=True)
 
     @on(Button.Pressed, "#update-status")
-    def update_status(self) -> None:
+    async def update_status(self) -> None:
         """Enable or disable user account."""
         status = self.query_one("#status", StatusBar)
-        enabled = self.query_one("#account-enabled", Checkbox).value
+        form = self._snapshot()
 
         user_pool_id = get_user_pool_id()
         if not user_pool_id:
@@ -503,14 +533,16 @@ class EditUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            if enabled:
-                client.admin_enable_user(
+            if form.enabled:
+                await asyncio.to_thread(
+                    client.admin_enable_user,
                     UserPoolId=user_pool_id,
                     Username=self.username,
                 )
                 status.set_message("User account enabled")
             else:
-                client.admin_disable_user(
+                await asyncio.to_thread(
+                    client.admin_disable_user,
                     UserPoolId=user_pool_id,
                     Username=self.username,
                 )
@@ -521,7 +553,7 @@ class EditUserScreen(Screen):
             status.set_message(f"Error: {error_msg}", error=True)
 
     @on(Button.Pressed, "#reset-mfa")
-    def reset_mfa(self) -> None:
+    async def reset_mfa(self) -> None:
         """Reset user MFA settings."""
         status = self.query_one("#status", StatusBar)
 
@@ -532,7 +564,8 @@ class EditUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            client.admin_set_user_mfa_preference(
+            await asyncio.to_thread(
+                client.admin_set_user_mfa_preference,
                 UserPoolId=user_pool_id,
                 Username=self.username,
                 SMSMfaSettings={"Enabled": False, "PreferredMfa": False},
@@ -545,7 +578,7 @@ class EditUserScreen(Screen):
             status.set_message(f"Error: {error_msg}", error=True)
 
     @on(Button.Pressed, "#add-to-group")
-    def add_to_group(self) -> None:
+    async def add_to_group(self) -> None:
         """Add user to selected group."""
         status = self.query_one("#status", StatusBar)
         group_select = self.query_one("#add-group", Select)
@@ -564,15 +597,22 @@ class EditUserScreen(Screen):
             status.set_message("Error: User Pool ID not configured", error=True)
             return
 
-        success, error_msg = add_user_to_group(user_pool_id, self.username, selected_group)
+        success, error_msg = await asyncio.to_thread(
+            add_user_to_group, user_pool_id, self.username, selected_group
+        )
         if success:
             status.set_message(f"Added user to group '{selected_group}'")
-            self.load_groups()  # Refresh group display
+            # The membership change is known locally; update the display
+            # without re-paginating every group in the pool.
+            self.current_groups.add(selected_group)
+            self.query_one("#current-groups", Static).update(
+                ", ".join(sorted(self.current_groups)) or "(none)"
+            )
         else:
             status.set_message(f"Error: {error_msg}", error=True)
 
     @on(Button.Pressed, "#remove-from-group")
-    def remove_from_group(self) -> None:
+    async def remove_from_group(self) -> None:
         """Remove user from selected group."""
         status = self.query_one("#status", StatusBar)
         group_select = self.query_one("#add-group", Select)
@@ -591,10 +631,15 @@ class EditUserScreen(Screen):
             status.set_message("Error: User Pool ID not configured", error=True)
             return
 
-        success, error_msg = remove_user_from_group(user_pool_id, self.username, selected_group)
+        success, error_msg = await asyncio.to_thread(
+            remove_user_from_group, user_pool_id, self.username, selected_group
+        )
         if success:
             status.set_message(f"Removed user from group '{selected_group}'")
-            self.load_groups()  # Refresh group display
+            self.current_groups.discard(selected_group)
+            self.query_one("#current-groups", Static).update(
+                ", ".join(sorted(self.current_groups)) or "(none)"
+            )
         else:
             status.set_message(f"Error: {error_msg}", error=True)
 
@@ -664,14 +709,14 @@ class CreateUserScreen(Screen):
         )
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Load available groups when screen mounts."""
-        self.load_groups()
+        await self.load_groups()
 
-    def load_groups(self) -> None:
+    async def load_groups(self) -> None:
         """Load available groups from Cognito."""
         user_pool_id = get_user_pool_id()
-        groups = fetch_user_pool_groups(user_pool_id)
+        groups = await asyncio.to_thread(fetch_user_pool_groups, user_pool_id)
 
         group_select = self.query_one("#group", Select)
         bulk_group_select = self.query_one("#bulk-group", Select)
@@ -680,7 +725,7 @@ class CreateUserScreen(Screen):
         bulk_group_select.set_options(groups)
 
     @on(Button.Pressed, "#create-single")
-    def create_single_user(self) -> None:
+    async def create_single_user(self) -> None:
         """Create a single user."""
         email = self.query_one("#email", Input).value.strip()
         password = self.query_one("#password", Input).value.strip() or DEFAULT_PASSWORD
@@ -700,7 +745,8 @@ class CreateUserScreen(Screen):
 
         try:
             client = get_cognito_client()
-            client.admin_create_user(
+            await asyncio.to_thread(
+                client.admin_create_user,
                 UserPoolId=user_pool_id,
                 Username=email,
                 UserAttributes=[
@@ -711,7 +757,8 @@ class CreateUserScreen(Screen):
                 ],
                 MessageAction="SUPPRESS",
             )
-            client.admin_set_user_password(
+            await asyncio.to_thread(
+                client.admin_set_user_password,
                 UserPoolId=user_pool_id,
                 Username=email,
                 Password=password,
@@ -721,7 +768,9 @@ class CreateUserScreen(Screen):
             # Add user to group if selected
             group_msg = ""
             if selected_group:
-                success, error_msg = add_user_to_group(user_pool_id, email, selected_group)
+                success, error_msg = await asyncio.to_thread(
+                    add_user_to_group, user_pool_id, email, selected_group
+                )
                 if success:
                     group_msg = f" and added to group '{selected_group}'"
                 else:
@@ -765,47 +814,69 @@ class CreateUserScreen(Screen):
             status.set_message("Error: User Pool ID not configured", error=True)
             return
 
+        # Hand off to a worker so the UI shows live progress instead of
+        # appearing frozen for the duration of the batch.
+        status.set_message(f"Creating {num_users} users...")
+        self._bulk_worker(num_users, user_pool_id, selected_group)
+
+    @work(thread=True, exclusive=True)
+    def _bulk_worker(self, num_users, user_pool_id, selected_group) -> None:
+        """Create test users on a worker thread, streaming progress.
+
+        Widget updates are marshalled back to the event loop with
+        call_from_thread; progress is surfaced every 10 completions.
+        """
+        status = self.query_one("#status", StatusBar)
         client = get_cognito_client()
-        created = 0
+
+        created_emails = []
         failed = 0
         group_added = 0
+        done = 0
+
+        # The per-user work is pure network I/O, so fan it out across a
+        # thread pool to overlap the AWS round-trips.
+        with ThreadPoolExecutor(max_workers=min(num_users, 20)) as executor:
+            futures = [
+                executor.submit(_create_one_test_user, i, client, user_pool_id)
+                for i in range(1, num_users + 1)
+            ]
+
+            for future in as_completed(futures):
+                was_created, email = future.result()
+                done += 1
+                if was_created:
+                    created_emails.append(email)
+                else:
+                    failed += 1
 
-        for i in range(1, num_users + 1):
-            email = f"testuser{i}@example.com"
-            try:
-                client.admin_create_user(
-                    UserPoolId=user_pool_id,
-                    Username=email,
-                    UserAttributes=[
-                        {"Name": "email", "Value": email},
-                        {"Name": "email_verified", "Value": "true"},
-                        {"Name": "phone_number", "Value": "+6587654321"},
-                        {"Name": "phone_number_verified", "Value": "true"},
-                    ],
-                    MessageAction="SUPPRESS",
-                )
-                client.admin_set_user_password(
-                    UserPoolId=user_pool_id,
-                    Username=email,
-                    Password=DEFAULT_PASSWORD,
-                    Permanent=True,
-                )
-                created += 1
+                if done % 10 == 0 and done < num_users:
+                    self.app.call_from_thread(
+                        status.set_message,
+                        f"Created {done}/{num_users} users...",
+                    )
 
-                # Add to group if selected
-                if selected_group:
-                    success, _ = add_user_to_group(user_pool_id, email, selected_group)
-                    if success:
-                        group_added += 1
-            except ClientError:
-                failed += 1
+            # Second batch: assign groups to the created users across the
+            # same pool, rather than serially inside each creation task.
+            if selected_group and created_emails:
+                results = executor.map(
+                    lambda email: add_user_to_group(
+                        user_pool_id, email, selected_group
+                    ),
+                    created_emails,
+                )
+                group_added = sum(1 for success, _ in results if success)
 
-        msg = f"Created: {created}, Failed/Skipped: {failed}"
+        msg = f"Created: {len(created_emails)}, Failed/Skipped: {failed}"
         if selected_group:
             msg += f", Added to group: {group_added}"
-        status.set_message(msg)
+        self.app.call_from_thread(status.set_message, msg)
+        self.app.call_from_thread(self._reset_bulk_form)
+
+    def _reset_bulk_form(self) -> None:
+        """Clear the bulk-create inputs after a run completes."""
         self.query_one("#num-users", Input).value = ""
-        bulk_group_select.value = Select.BLANK
+        self.query_one("#bulk-group", Select).value = Select.BLANK
 
     @on(Button.Pressed, "#back")
     def go_back(self) -> None:
@@ -857,72 +928,114 @@ class UsersScreen(Screen):
         table.add_column("Created", key="created")
         table.cursor_type = "row"
         self.selected_users: set[str] = set()
+        # Username -> DataTable RowKey, for O(1) row lookups on per-user
+        # operations; rebuilt by load_users.
+        self._row_by_username: dict[str, object] = {}
+        # The client and exclusion set are stable for the life of the
+        # screen; fetch them once instead of on every refresh and delete.
+        self._client = get_cognito_client()
+        # Normalized to lowercase once; emails are case-insensitive but
+        # Cognito stores them as entered.
+        self._excluded = frozenset(e.lower() for e in get_excluded_users())
         self.load_users()
 
+    @work(thread=True, exclusive=True, group="cognito")
     def load_users(self) -> None:
-        """Load users from Cognito."""
+        """Load users from Cognito on a worker thread.
+
+        Pagination happens off the event loop so the UI keeps painting
+        and handling keys; widget updates are marshalled back with
+        call_from_thread.
+        """
         table = self.query_one("#users-table", DataTable)
         status = self.query_one("#status", StatusBar)
-        table.clear()
+        call = self.app.call_from_thread
+
+        call(status.set_message, "Loading users...")
+        call(table.clear)
         self.selected_users.clear()
+        self._row_by_username.clear()
 
         user_pool_id = get_user_pool_id()
         if not user_pool_id:
-            status.set_message("Error: User Pool ID not configured", error=True)
+            call(status.set_message, "Error: User Pool ID not configured", error=True)
             return
 
         try:
-            client = get_cognito_client()
-            excluded = set(get_excluded_users())
-            pagination_token = None
-            users = []
-
-            while True:
-                kwargs = {"UserPoolId": user_pool_id}
-                if pagination_token:
-                    kwargs["PaginationToken"] = pagination_token
-
-                response = client.list_users(**kwargs)
-
-                for user in response["Users"]:
-                    username = user["Username"]
-                    email = ""
-                    for attr in user.get("Attributes", []):
-                        if attr["Name"] == "email":
-                            email = attr["Value"]
-                            break
-
-                    user_status = user.get("UserStatus", "UNKNOWN")
-                    enabled = "Yes" if user.get("Enabled", False) else "No"
-                    created = user.get("UserCreateDate", "")
-                    if created:
-                        created = created.strftime("%Y-%m-%d %H:%M")
-
-                    is_excluded = username in excluded or email in excluded
-                    select_marker = "[E]" if is_excluded else "[ ]"
-
-                    users.append((select_marker, username, email, user_status, enabled, created))
-
-                pagination_token = response.get("PaginationToken")
-                if not pagination_token:
-                    break
-
-            for user_data in users:
-                table.add_row(*user_data)
+            # The paginator handles PaginationToken bookkeeping; pages are
+            # pulled through a single-thread executor so the next HTTPS
+            # round-trip overlaps with parsing the current page, hiding
+            # most of the per-page network latency.
+            pages = iter(
+                self._client.get_paginator("list_users").paginate(
+                    UserPoolId=user_pool_id,
+                    # Only email is read from the attributes; skip sub,
+                    # phone, custom:* and the rest of the payload.
+                    AttributesToGet=["email"],
+                    # 60 is the list_users maximum page size; fewer
+                    # round-trips than the server-chosen default.
+                    PaginationConfig={"PageSize": 60},
+                )
+            )
 
-            status.set_message(f"Loaded {len(users)} users")
+            users = []
+            # Hoist attribute lookups out of the per-user loop; bound
+            # methods and the format string become plain locals.
+            fmt = _DATE_FMT
+            excluded = self._excluded
+            users_append = users.append
+
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                next_page = prefetcher.submit(next, pages, None)
+
+                while True:
+                    response = next_page.result()
+                    if response is None:
+                        break
+                    next_page = prefetcher.submit(next, pages, None)
+
+                    for user in response["Users"]:
+                        username = user["Username"]
+                        email = next(
+                            (
+                                a["Value"]
+                                for a in user.get("Attributes", ())
+                                if a["Name"] == "email"
+                            ),
+                            "",
+                        )
+
+                        user_status = user.get("UserStatus", "UNKNOWN")
+                        enabled = "Yes" if user.get("Enabled", False) else "No"
+                        created = user.get("UserCreateDate", "")
+                        created = created.strftime(fmt) if created else ""
+
+                        is_excluded = username.lower() in excluded or (
+                            email and email.lower() in excluded
+                        )
+                        select_marker = "[E]" if is_excluded else "[ ]"
+
+                        users_append((select_marker, username, email, user_status, enabled, created))
+
+            # One add_rows call means one reactive update and layout pass,
+            # instead of one per row; the returned row keys are indexed by
+            # username for O(1) lookups later.
+            row_keys = call(table.add_rows, users)
+            self._row_by_username = dict(zip((u[1] for u in users), row_keys))
+
+            call(status.set_message, f"Loaded {len(users)} users")
 
         except ClientError as e:
-            status.set_message(f"Error loading users: {e}", error=True)
+            call(status.set_message, f"Error loading users: {e}", error=True)
 
     def get_selected_row_username(self) -> str | None:
         """Get username from currently highlighted row."""
         table = self.query_one("#users-table", DataTable)
-        if table.cursor_row is not None and table.row_count > 0:
-            row_key = table.coordinate_to_cell_key((table.cursor_row, 0)).row_key
-            row_data = table.get_row(row_key)
-            return row_data[1]  # Username column
-        return None
+        if table.cursor_row is None or table.row_count == 0:
+            return None
+        # get_row_at indexes by cursor position directly, skipping the
+        # coordinate-to-key round-trip.
+        return table.get_row_at(table.cursor_row)[1]  # Username column
 
     @on(DataTable.RowSelected)
     def toggle_selection(self, event: DataTable.RowSelected) -> None:
@@ -980,87 +1093,180 @@ class UsersScreen(Screen):
         self.app.push_screen(EditUserScreen(username))
 
     @on(Button.Pressed, "#delete-selected")
+    @work(thread=True, exclusive=True, group="cognito")
     def action_delete_selected(self) -> None:
-        """Delete selected users."""
+        """Delete selected users on a worker thread."""
         status = self.query_one("#status", StatusBar)
+        call = self.app.call_from_thread
 
         if not self.selected_users:
-            status.set_message("No users selected (use Enter to select)", error=True)
+            call(status.set_message, "No users selected (use Enter to select)", error=True)
             return
 
         user_pool_id = get_user_pool_id()
         if not user_pool_id:
-            status.set_message("Error: User Pool ID not configured", error=True)
+            call(status.set_message, "Error: User Pool ID not configured", error=True)
             return
 
-        try:
-            client = get_cognito_client()
-            deleted = 0
+        # Snapshot the selection: toggle_selection can mutate the set from
+        # the UI thread while this worker is still iterating it.
+        usernames = list(self.selected_users)
 
-            for username in list(self.selected_users):
-                client.admin_delete_user(
+        call(status.set_message, f"Deleting {len(usernames)} users...")
+
+        def _delete_one(username):
+            """Delete one user; returns (ok, username)."""
+            try:
+                self._client.admin_delete_user(
                     UserPoolId=user_pool_id,
                     Username=username,
                 )
-                deleted += 1
+                return True, username
+            except ClientError as e:
+                return False, f"{username}: {e.response.get('Error', {}).get('Message', e)}"
+
+        deleted_usernames = []
+        failures = []
+
+        # Each delete is a blocking HTTPS round-trip and the client is
+        # thread-safe, so overlap them across a pool.
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(_delete_one, username) for username in usernames
+            ]
+            for future in as_completed(futures):
+                ok, detail = future.result()
+                if ok:
+                    deleted_usernames.append(detail)
+                else:
+                    failures.append(detail)
+
+        if failures:
+            # Something went wrong mid-batch; re-fetch rather than guess
+            # at the table's true state.
+            call(
+                status.set_message,
+                f"Deleted {len(deleted_usernames)} users; failed: {'; '.join(failures)}",
+                error=True,
+            )
+            call(self.load_users)
+        else:
+            # The deletions are known locally, so drop just those rows
+            # instead of re-paginating the whole pool.
+            call(self._remove_deleted_rows, deleted_usernames)
 
-            status.set_message(f"Deleted {deleted} users")
-            self.load_users()
+    def _remove_deleted_rows(self, deleted_usernames: list[str]) -> None:
+        """Drop the given users' rows from the table after a delete."""
+        table = self.query_one("#users-table", DataTable)
+        status = self.query_one("#status", StatusBar)
 
-        except ClientError as e:
-            status.set_message(f"Error deleting users: {e}", error=True)
+        to_remove = set(deleted_usernames)
+        for username in deleted_usernames:
+            row_key = self._row_by_username.pop(username, None)
+            if row_key is not None:
+                table.remove_row(row_key)
+
+        self.selected_users -= to_remove
+        status.set_message(
+            f"Deleted {len(deleted_usernames)} users ({table.row_count} remaining)"
+        )
 
     @on(Button.Pressed, "#delete-all")
+    @work(thread=True, exclusive=True, group="cognito")
     def delete_all_users(self) -> None:
-        """Delete all users except excluded ones."""
+        """Delete all users except excluded ones, on a worker thread."""
         status = self.query_one("#status", StatusBar)
+        call = self.app.call_from_thread
 
         user_pool_id = get_user_pool_id()
         if not user_pool_id:
-            status.set_message("Error: User Pool ID not configured", error=True)
+            call(status.set_message, "Error: User Pool ID not configured", error=True)
             return
 
+        call(status.set_message, "Deleting users...")
+
+        def _delete_one(username):
+            """Delete one user; returns (ok, username)."""
+            try:
+                self._client.admin_delete_user(
+                    UserPoolId=user_pool_id,
+                    Username=username,
+                )
+                return True, username
+            except ClientError as e:
+                return False, username
+
+        deleted = 0
+        failed = 0
+
         try:
-            client = get_cognito_client()
-            excluded = set(get_excluded_users())
+            # Collect the whole pool first, then delete the set difference.
+            # Cognito's ListUsers Filter cannot express "not one of these
+            # usernames", so exclusion stays client-side — but a single
+            # set subtraction replaces the per-user membership checks, and
+            # listing finishes before the pool is mutated underneath the
+            # pagination cursor.
+            all_usernames = set()
+            excluded_matched = set()
             pagination_token = None
-            deleted = 0
-            skipped = 0
 
             while True:
-                kwargs = {"UserPoolId": user_pool_id}
+                kwargs = {
+                    "UserPoolId": user_pool_id,
+                    # Exclusion checks only need the email attribute.
+                    "AttributesToGet": ["email"],
+                    # 60 is the list_users maximum page size.
+                    "Limit": 60,
+                }
                 if pagination_token:
                     kwargs["PaginationToken"] = pagination_token
 
-                response = client.list_users(**kwargs)
+                response = self._client.list_users(**kwargs)
 
                 for user in response["Users"]:
                     username = user["Username"]
-                    email = ""
-                    for attr in user.get("Attributes", []):
-                        if attr["Name"] == "email":
-                            email = attr["Value"]
-                            break
-
-                    if username in excluded or email in excluded:
-                        skipped += 1
-                        continue
-
-                    client.admin_delete_user(
-                        UserPoolId=user_pool_id,
-                        Username=username,
+                    email = next(
+                        (
+                            a["Value"]
+                            for a in user.get("Attributes", ())
+                            if a["Name"] == "email"
+                        ),
+                        "",
                     )
-                    deleted += 1
+
+                    all_usernames.add(username)
+                    if username.lower() in self._excluded or (
+                        email and email.lower() in self._excluded
+                    ):
+                        excluded_matched.add(username)
 
                 pagination_token = response.get("PaginationToken")
                 if not pagination_token:
                     break
 
-            status.set_message(f"Deleted: {deleted}, Skipped: {skipped} (excluded)")
-            self.load_users()
+            to_delete = all_usernames - excluded_matched
+            skipped = len(excluded_matched)
+
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                futures = [
+                    executor.submit(_delete_one, username) for username in to_delete
+                ]
+
+                for future in as_completed(futures):
+                    ok, _ = future.result()
+                    if ok:
+                        deleted += 1
+                    else:
+                        failed += 1
+
+            msg = f"Deleted: {deleted}, Skipped: {skipped} (excluded)"
+            if failed:
+                msg += f", Failed: {failed}"
+            call(status.set_message, msg, error=bool(failed))
+            call(self.load_users)
 
         except ClientError as e:
-            status.set_message(f"Error deleting users: {e}", error=True)
+            call(status.set_message, f"Error deleting users: {e}", error=True)
 
     @on(Button.Pressed, "#back")
     def go_back(self) -> None:
@@ -1097,18 +1303,7 @@ class SettingsScreen(Screen):
 
     def on_mount(self) -> None:
         """Display current configuration."""
-        from .config import get_aws_config
-
-        config = get_aws_config()
-        user_pool_id = get_user_pool_id()
-        excluded_users = get_excluded_users()
-
-        config_text = f"""AWS Region: {config.get('region_name', 'Not set')}
-AWS Access Key ID: {'*' * 16 + config.get('aws_access_key_id', '')[-4:] if config.get('aws_access_key_id') else 'Not set'}
-User Pool ID: {user_pool_id or 'Not set'}
-Excluded Users: {', '.join(excluded_users) if excluded_users else 'None'}
-"""
-        self.query_one("#config-display", Static).update(config_text)
+        self.query_one("#config-display", Static).update(_config_display_text())
 
     @on(Button.Pressed, "#back")
     def go_back(self) -> None:
@@ -1160,155 +1355,9 @@ class CognitoUserApp(App):
     """Main Cognito User Management TUI Application."""
 
     TITLE = "AWS Cognito User Manager"
-    CSS = """
-    Screen {
-        align: center middle;
-    }
-
-    #main-container {
-        width: 60;
-        height: auto;
-        padding: 2 4;
-        background: $surface;
-        border: thick $primary;
-    }
-
-    #create-container, #users-container, #settings-outer, #view-container, #edit-outer {
-        width: 90%;
-        height: 90%;
-        padding: 1 2;
-        background: $surface;
-        border: thick $primary;
-    }
-
-    .menu-container {
-        align: center middle;
-        height: auto;
-    }
-
-    .menu-container Button {
-        width: 100%;
-        margin: 1 0;
-    }
-
-    .app-title {
-        text-align: center;
-        text-style: bold;
-        color: $primary;
-        padding: 1 0;
-        width: 100%;
-    }
-
-    .title {
-        text-align: center;
-        text-style: bold;
-        color: $primary;
-        padding: 1 0;
-        width: 100%;
-    }
-
-    .subtitle {
-        text-style: bold;
-        color: $secondary;
-        padding: 1 0;
-    }
-
-    .separator {
-        height: 1;
-    }
-
-    .form-container, .details-container, .edit-container {
-        padding: 1 2;
-    }
-
-    .form-row {
-        height: 3;
-        margin: 1 0;
-    }
-
-    .form-row Label {
-        width: 20;
-        padding: 1 1;
-    }
-
-    .form-row Input {
-        width: 1fr;
-    }
-
-    .form-row Select {
-        width: 1fr;
-    }
-
-    .form-row Static {
-        width: 1fr;
-        padding: 1 1;
-    }
-
-    .checkbox-row {
-        height: 3;
-        margin: 1 0;
-        padding: 0 1;
-    }
-
-    .checkbox-row Checkbox {
-        margin-right: 4;
-    }
-
-    .button-row {
-        height: auto;
-        margin: 1 0;
-        align: center middle;
-    }
-
-    .button-row Button {
-        margin: 0 1;
-    }
-
-    .table-container {
-        height: 100%;
-    }
-
-    .table-container DataTable {
-        height: 1fr;
-        margin: 1 0;
-    }
-
-    .settings-container {
-        padding: 1 2;
-    }
-
-    #config-display, #user-details, #user-attributes {
-        padding: 1 2;
-        background: $surface-darken-1;
-        border: round $primary;
-        margin: 1 0;
-    }
-
-    .note {
-        color: $text-muted;
-        text-style: italic;
-        padding: 0 0 0 1;
-    }
-
-    StatusBar {
-        height: 2;
-        padding: 0 1;
-        background: $surface-darken-1;
-        margin: 1 0;
-    }
-
-    StatusBar.error {
-        color: $error;
-    }
-
-    .label {
-        width: 20;
-    }
-
-    Button.warning {
-        background: $warning;
-    }
-    """
+    # Stylesheet lives in tui.tcss so Textual parses it once and caches
+    # it, and can hot-reload it during development.
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),